@@ -2,11 +2,29 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import functools
+
+
+# same as the maximum number of columns of a spreadsheet (A to XFD)
+_MAX_CACHED_IDX = 16384
+
 
 def convert_idx_to_alphabet(idx: int) -> str:
+    if 0 <= idx < _MAX_CACHED_IDX:
+        return _to_cached_alphabet(idx)
+
+    return _to_alphabet(idx)
+
+
+@functools.lru_cache(maxsize=_MAX_CACHED_IDX)
+def _to_cached_alphabet(idx: int) -> str:
+    return _to_alphabet(idx)
+
+
+def _to_alphabet(idx: int) -> str:
     if idx < 26:
         return chr(65 + idx)
 
     div, mod = divmod(idx, 26)
 
-    return convert_idx_to_alphabet(div - 1) + convert_idx_to_alphabet(mod)
+    return _to_alphabet(div - 1) + _to_alphabet(mod)
@@ -2,16 +2,81 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
-from typing import Any, List, Sequence, Tuple
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from .error import DataError
 
 
+RowConverter = Callable[[Any], Any]
+
+
 def to_value_matrix(headers: Sequence[str], value_matrix) -> List:
     if value_matrix is None:
         return []
 
-    return [_to_row(headers, values, row_idx)[1] for row_idx, values in enumerate(value_matrix)]
+    headers = tuple(headers) if headers else ()
+    row_converters: Dict[type, Optional[RowConverter]] = {}
+    rows = []
+
+    for row_idx, values in enumerate(value_matrix):
+        row_type = type(values)
+
+        try:
+            to_row = row_converters[row_type]
+        except KeyError:
+            to_row = row_converters[row_type] = _make_row_converter(headers, row_type)
+
+        if to_row is None:
+            rows.append(_to_row(headers, values, row_idx)[1])
+        else:
+            rows.append(to_row(values))
+
+    return rows
+
+
+def _make_row_converter(headers: Tuple[str, ...], row_type: type) -> Optional[RowConverter]:
+    # returns None for row types that need the per-row checks of _to_row()
+    if issubclass(row_type, tuple) and hasattr(row_type, "_fields"):
+        # namedtuple
+        if not headers:
+            return _to_identity
+
+        field_indices = {field: idx for idx, field in enumerate(row_type._fields)}
+        if not all(header in field_indices for header in headers):
+            return None
+
+        get_values = itemgetter(*(field_indices[header] for header in headers))
+        if len(headers) == 1:
+            return lambda values: [get_values(values)]
+
+        return lambda values: list(get_values(values))
+
+    if hasattr(row_type, "_asdict"):
+        return None
+
+    if headers and issubclass(row_type, dict):
+
+        def to_dict_row(values) -> List:
+            try:
+                return list(map(values.get, headers))
+            except (TypeError, AttributeError):
+                # e.g. unhashable headers: report the same way as _to_row() does
+                return _to_row(headers, values, -1)[1]
+
+        return to_dict_row
+
+    if hasattr(row_type, "get"):
+        return None
+
+    if issubclass(row_type, (tuple, list)):
+        return _to_identity
+
+    return None
+
+
+def _to_identity(values):
+    return values
 
 
 def _to_row(headers: Sequence[str], values, row_idx: int) -> Tuple[int, Any]:
@@ -3,9 +3,11 @@
 """
 
 import copy
+import functools
 import re
-from collections import OrderedDict, namedtuple
-from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from collections import namedtuple
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import dataproperty as dp
 import typepy
@@ -15,6 +17,23 @@ from typepy import Nan
 from ._constant import PatternMatch
 from ._converter import to_value_matrix
 from ._logger import logger
+from .error import DataError
+
+
+_get_dp_data = attrgetter("data")
+
+
+def _is_nan(value: Any) -> bool:
+    # int/float cells are the common case: avoid typepy type dispatch for them
+    value_type = type(value)
+
+    if value_type is int:
+        return False
+
+    if value_type is float:
+        return value != value
+
+    return Nan(value).is_type()
 
 
 class TableData:
@@ -26,6 +45,15 @@ class TableData:
     :param rows: Data of the table.
     """
 
+    __slots__ = (
+        "__table_name",
+        "__value_matrix",
+        "__value_dp_matrix",
+        "__rows",
+        "__dp_extractor",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         table_name: Optional[str],
@@ -61,7 +89,7 @@ class TableData:
         if not headers:
             self.__dp_extractor.headers = []
         else:
-            self.__dp_extractor.headers = headers
+            self.__dp_extractor.headers = list(headers)
 
     def __repr__(self) -> str:
         element_list = [f"table_name={self.table_name}"]
@@ -76,10 +104,13 @@ class TableData:
         return ", ".join(element_list)
 
     def __eq__(self, other) -> bool:
-        return self.equals(other, cmp_by_dp=False)
+        if self is other:
+            return True
 
-    def __ne__(self, other) -> bool:
-        return not self.equals(other, cmp_by_dp=False)
+        if not isinstance(other, TableData):
+            return NotImplemented
+
+        return self.equals(other, cmp_by_dp=False)
 
     @property
     def table_name(self) -> Optional[str]:
@@ -99,7 +130,7 @@ class TableData:
         """Get the table header names.
 
         Returns:
-            |list| or |tuple|: Table header names.
+            |list|: Table header names.
         """
 
         return self.__dp_extractor.headers
@@ -112,6 +143,12 @@ class TableData:
             |list| or |tuple|: Table rows.
         """
 
+        try:
+            len(self.__rows)
+        except TypeError:
+            # materialize iterators only once so that rows can be read repeatedly
+            self.__rows = list(self.__rows)
+
         return self.__rows
 
     @property
@@ -122,11 +159,11 @@ class TableData:
             |list| or |tuple|: Table rows.
         """
 
-        if self.__value_matrix:
+        if self.__value_matrix is not None:
             return self.__value_matrix
 
         self.__value_matrix = [
-            [value_dp.data for value_dp in value_dp_list] for value_dp_list in self.value_dp_matrix
+            list(map(_get_dp_data, value_dp_list)) for value_dp_list in self.value_dp_matrix
         ]
 
         return self.__value_matrix
@@ -148,12 +185,12 @@ class TableData:
         """
         :return:
             Number of rows in the tabular data.
-            |None| if the ``rows`` is neither list nor tuple.
+            |None| if the ``rows`` is an iterator that has not been consumed yet.
         :rtype: int
         """
 
         try:
-            return len(self.rows)
+            return len(self.__rows)
         except TypeError:
             return None
 
@@ -163,7 +200,7 @@ class TableData:
             return len(self.headers)
 
         try:
-            return len(self.rows[0])
+            return len(self.__rows[0])
         except TypeError:
             return None
         except IndexError:
@@ -219,7 +256,7 @@ class TableData:
         :rtype: bool
         """
 
-        return any([self.is_empty_header(), self.is_empty_rows()])
+        return self.is_empty_header() or self.is_empty_rows()
 
     def equals(self, other, cmp_by_dp: bool = True) -> bool:
         if cmp_by_dp:
@@ -228,12 +265,12 @@ class TableData:
         return self.__equals_raw(other)
 
     def __equals_base(self, other) -> bool:
-        compare_item_list = [self.table_name == other.table_name]
+        if self.table_name != other.table_name:
+            return False
 
-        if self.num_rows is not None:
-            compare_item_list.append(self.num_rows == other.num_rows)
+        num_rows = self.num_rows
 
-        return all(compare_item_list)
+        return num_rows is None or num_rows == other.num_rows
 
     def __equals_raw(self, other) -> bool:
         if not self.__equals_base(other):
@@ -243,6 +280,12 @@ class TableData:
             return False
 
         for lhs_row, rhs_row in zip(self.rows, other.rows):
+            if type(lhs_row) is type(rhs_row) and type(lhs_row) in (list, tuple):
+                # compare the whole row in C first: NaN-aware per-cell comparison is only
+                # needed for rows that differ
+                if lhs_row == rhs_row:
+                    continue
+
             if len(lhs_row) != len(rhs_row):
                 return False
 
@@ -250,7 +293,7 @@ class TableData:
                 [
                     lhs == rhs
                     for lhs, rhs in zip(lhs_row, rhs_row)
-                    if not Nan(lhs).is_type() and not Nan(rhs).is_type()
+                    if not _is_nan(lhs) and not _is_nan(rhs)
                 ]
             ):
                 return False
@@ -288,21 +331,33 @@ class TableData:
         :raises ValueError:
         """
 
-        invalid_row_idx_list = []
+        headers = self.headers
+        num_headers = len(headers)
+
+        try:
+            header_set: Optional[frozenset] = frozenset(headers)
+        except TypeError:
+            # unhashable header
+            header_set = None
+
+        def is_missing_header(row: dict) -> bool:
+            if header_set is None:
+                return not all(header in row for header in headers)
 
-        for row_idx, row in enumerate(self.rows):
-            if isinstance(row, (list, tuple)) and len(self.headers) != len(row):
-                invalid_row_idx_list.append(row_idx)
+            return not row.keys() >= header_set
 
-            if isinstance(row, dict):
-                if not all([header in row for header in self.headers]):
-                    invalid_row_idx_list.append(row_idx)
+        invalid_row_idx_list = [
+            row_idx
+            for row_idx, row in enumerate(self.rows)
+            if (isinstance(row, (list, tuple)) and len(row) != num_headers)
+            or (isinstance(row, dict) and is_missing_header(row))
+        ]
 
         if not invalid_row_idx_list:
             return
 
         for invalid_row_idx in invalid_row_idx_list:
-            logger.debug(f"invalid row (line={invalid_row_idx}): {self.rows[invalid_row_idx]}")
+            logger.debug("invalid row (line={}): {}", invalid_row_idx, self.rows[invalid_row_idx])
 
         raise ValueError(
             "table header length and row length are mismatch:\n"
@@ -312,7 +367,7 @@ class TableData:
             )
         )
 
-    def as_dict(self, default_key: str = "table") -> Dict[str, List["OrderedDict[str, Any]"]]:
+    def as_dict(self, default_key: str = "table") -> Dict[str, List[Dict[str, Any]]]:
         """
         Args:
             default_key:
@@ -335,7 +390,7 @@ class TableData:
         Output:
             .. code:: json
 
-                {'sample': [OrderedDict([('a', 1), ('b', 2)]), OrderedDict([('a', 3.3), ('b', 4.4)])]}
+                {'sample': [{'a': 1, 'b': 2}, {'a': Decimal('3.3'), 'b': Decimal('4.4')}]}
         """  # noqa
 
         dict_body = []
@@ -343,14 +398,14 @@ class TableData:
             if not row:
                 continue
 
-            values = [
-                (header, value) for header, value in zip(self.headers, row) if value is not None
-            ]
+            values = {
+                header: value for header, value in zip(self.headers, row) if value is not None
+            }
 
             if not values:
                 continue
 
-            dict_body.append(OrderedDict(values))
+            dict_body.append(values)
 
         table_name = self.table_name
         if not table_name:
@@ -389,7 +444,7 @@ class TableData:
             if typepy.is_empty_sequence(value_dp_list):
                 continue
 
-            row = Row(*(value_dp.data for value_dp in value_dp_list))
+            row = Row._make(map(_get_dp_data, value_dp_list))
 
             yield row
 
@@ -447,48 +502,61 @@ class TableData:
         pattern_match: PatternMatch = PatternMatch.OR,
     ) -> "TableData":
         logger.debug(
-            "filter_column: patterns={}, is_invert_match={}, "
-            "is_re_match={}, pattern_match={}".format(
-                patterns, is_invert_match, is_re_match, pattern_match
-            )
+            "filter_column: patterns={}, is_invert_match={}, is_re_match={}, pattern_match={}",
+            patterns,
+            is_invert_match,
+            is_re_match,
+            pattern_match,
         )
 
         if not patterns:
             return self
 
-        match_header_list = []
-        match_column_matrix = []
+        try:
+            is_match_header = self.__make_header_matcher(
+                tuple(patterns), is_invert_match, is_re_match, pattern_match
+            )
+        except TypeError:
+            # unhashable patterns can not be a cache key
+            is_match_header = self.__make_header_matcher.__wrapped__(
+                tuple(patterns), is_invert_match, is_re_match, pattern_match
+            )
 
-        if pattern_match == PatternMatch.OR:
-            match_method = any
-        elif pattern_match == PatternMatch.AND:
-            match_method = all
-        else:
-            raise ValueError(f"unknown matching: {pattern_match}")
+        headers = self.headers
+        match_col_indices = [
+            col_idx for col_idx, header in enumerate(headers) if is_match_header(header)
+        ]
 
-        for header, column in zip(self.headers, zip(*self.rows)):
-            is_match_list = []
-            for pattern in patterns:
-                is_match = self.__is_match(header, pattern, is_re_match)
+        if match_col_indices:
+            try:
+                rows = to_value_matrix(headers, self.rows)
+            except DataError:
+                # rows that are neither sequences nor mappings: select columns by position
+                rows = [list(row) for row in self.rows]
 
-                is_match_list.append(
-                    any([is_match and not is_invert_match, not is_match and is_invert_match])
-                )
+            # columns that are missing in some rows are dropped, as zip() does
+            num_columns = min(map(len, rows), default=len(headers))
+            match_col_indices = [col_idx for col_idx in match_col_indices if col_idx < num_columns]
 
-            if match_method(is_match_list):
-                match_header_list.append(header)
-                match_column_matrix.append(column)
+        match_header_list = [headers[col_idx] for col_idx in match_col_indices]
 
         logger.debug(
-            "filter_column: table={}, match_header_list={}".format(
-                self.table_name, match_header_list
-            )
+            "filter_column: table={}, match_header_list={}", self.table_name, match_header_list
         )
 
+        if not match_col_indices:
+            return TableData(self.table_name, [], [], max_workers=self.max_workers)
+
+        get_columns = itemgetter(*match_col_indices)
+        if len(match_col_indices) == 1:
+            match_rows = [[get_columns(row)] for row in rows]
+        else:
+            match_rows = [list(get_columns(row)) for row in rows]
+
         return TableData(
             self.table_name,
             match_header_list,
-            list(zip(*match_column_matrix)),
+            match_rows,
             max_workers=self.max_workers,
         )
 
@@ -515,8 +583,60 @@ class TableData:
         )
 
     @staticmethod
-    def __is_match(header: str, pattern: str, is_re_match: bool) -> bool:
-        if is_re_match:
-            return re.search(pattern, header) is not None
+    @functools.lru_cache(maxsize=32)
+    def __make_header_matcher(
+        patterns: Tuple[str, ...],
+        is_invert_match: bool,
+        is_re_match: bool,
+        pattern_match: PatternMatch,
+    ) -> Callable[[str], bool]:
+        if pattern_match == PatternMatch.OR:
+            match_method = any
+        elif pattern_match == PatternMatch.AND:
+            match_method = all
+        else:
+            raise ValueError(f"unknown matching: {pattern_match}")
+
+        is_any_match = (pattern_match == PatternMatch.OR) != is_invert_match
+
+        if not is_re_match:
+            try:
+                pattern_set = frozenset(patterns)
+            except TypeError:
+                # unhashable pattern
+                is_any_match = False
+
+            if is_any_match:
+                # OR of matches, or AND of non-matches (= none of the patterns match):
+                # both reduce to a single test of "does any pattern match".
+                def is_match_header(header) -> bool:
+                    try:
+                        is_match = header in pattern_set
+                    except TypeError:
+                        # unhashable header
+                        is_match = any(header == pattern for pattern in patterns)
+
+                    return is_match != is_invert_match
+
+                return is_match_header
 
-        return header == pattern
+            return lambda header: match_method(
+                (header == pattern) != is_invert_match for pattern in patterns
+            )
+
+        regexps = [re.compile(pattern) for pattern in patterns]
+
+        # fusing patterns into one alternation renumbers capture groups (breaking
+        # backreferences) and spreads global inline flags to the other patterns
+        if is_any_match and all(
+            regexp.groups == 0 and regexp.flags == re.UNICODE for regexp in regexps
+        ):
+            union_regexp = re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+            return lambda header: (union_regexp.search(header) is None) == is_invert_match
+
+        searches = [regexp.search for regexp in regexps]
+
+        return lambda header: match_method(
+            (search(header) is None) == is_invert_match for search in searches
+        )
@@ -2,8 +2,6 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
-import dataproperty
-
 from ._null_logger import NullLogger
 
 
@@ -26,6 +24,8 @@ def set_logger(is_enable, propagation_depth=1):
     if propagation_depth <= 0:
         return
 
+    import dataproperty
+
     dataproperty.set_logger(is_enable, propagation_depth - 1)
 
 
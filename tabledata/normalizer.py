@@ -18,6 +18,8 @@ class TableDataNormalizerInterface(metaclass=abc.ABCMeta):
     Interface class to validate and normalize data of |TableData|.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def validate(self) -> None:  # pragma: no cover
         pass
@@ -28,6 +30,8 @@ class TableDataNormalizerInterface(metaclass=abc.ABCMeta):
 
 
 class AbstractTableDataNormalizer(TableDataNormalizerInterface):
+    __slots__ = ("_tabledata", "__weakref__")
+
     @property
     def _type_hints(self):
         return self._tabledata.dp_extractor.column_type_hints
@@ -53,7 +57,7 @@ class AbstractTableDataNormalizer(TableDataNormalizerInterface):
         :rtype: tabledata.TableData
         """
 
-        logger.debug(f"normalize: {type(self).__name__}")
+        logger.debug("normalize: {}", type(self).__name__)
 
         normalize_headers = self._normalize_headers()
 
@@ -139,9 +143,27 @@ class AbstractTableDataNormalizer(TableDataNormalizerInterface):
     def _normalize_rows(self, normalize_headers: Sequence[str]) -> List:
         return self._tabledata.rows  # type: ignore
 
+    def _is_normalized_table_name_valid(self) -> bool:
+        """
+        Return |True| if a table name returned by :py:meth:`~._normalize_table_name`
+        always passes :py:meth:`~._validate_table_name`: skips the re-validation.
+        """
+
+        return False
+
+    def _is_normalized_header_valid(self) -> bool:
+        """
+        Return |True| if a header returned by :py:meth:`~._normalize_header`
+        always passes :py:meth:`~._validate_header`: skips the re-validation.
+        """
+
+        return False
+
     def _validate_headers(self) -> None:
+        validate_header = self._validate_header
+
         for header in self._tabledata.headers:
-            self._validate_header(header)
+            validate_header(header)
 
     def __normalize_table_name(self) -> str:
         preprocessed_table_name = self._preprocess_table_name()
@@ -151,22 +173,35 @@ class AbstractTableDataNormalizer(TableDataNormalizerInterface):
             new_table_name = preprocessed_table_name
         except InvalidTableNameError:
             new_table_name = self._normalize_table_name(preprocessed_table_name)
-            self._validate_table_name(new_table_name)
+            if not self._is_normalized_table_name_valid():
+                self._validate_table_name(new_table_name)
 
         return new_table_name
 
     def _normalize_headers(self) -> List[str]:
-        new_header_list = []
+        preprocess_header = self._preprocess_header
 
-        for col_idx, header in enumerate(self._tabledata.headers):
-            header = self._preprocess_header(col_idx, header)
+        return self._normalize_header_list(
+            [
+                preprocess_header(col_idx, header)
+                for col_idx, header in enumerate(self._tabledata.headers)
+            ]
+        )
 
+    def _normalize_header_list(self, headers: Sequence[str]) -> List[str]:
+        validate_header = self._validate_header
+        normalize_header = self._normalize_header
+        is_normalized_header_valid = self._is_normalized_header_valid()
+        new_header_list = []
+
+        for header in headers:
             try:
-                self._validate_header(header)
+                validate_header(header)
                 new_header = header
             except InvalidHeaderNameError:
-                new_header = self._normalize_header(header)
-                self._validate_header(new_header)
+                new_header = normalize_header(header)
+                if not is_normalized_header_valid:
+                    validate_header(new_header)
 
             new_header_list.append(new_header)
 
@@ -174,6 +209,8 @@ class AbstractTableDataNormalizer(TableDataNormalizerInterface):
 
 
 class TableDataNormalizer(AbstractTableDataNormalizer):
+    __slots__ = ()
+
     def _preprocess_table_name(self) -> str:
         if not self._tabledata.table_name:
             return ""
@@ -181,6 +218,9 @@ class TableDataNormalizer(AbstractTableDataNormalizer):
         return self._tabledata.table_name
 
     def _validate_table_name(self, table_name: str) -> None:
+        if isinstance(table_name, str) and table_name:
+            return
+
         try:
             typepy.String(table_name).validate()
         except TypeError as e:
@@ -192,7 +232,35 @@ class TableDataNormalizer(AbstractTableDataNormalizer):
     def _preprocess_header(self, col_idx: int, header: str) -> str:
         return header
 
+    def _is_normalized_table_name_valid(self) -> bool:
+        # typepy.String.force_convert() always returns a str, which always passes
+        # the validation. Re-validate if a subclass overrides either of them.
+        cls = type(self)
+
+        return (
+            cls._validate_table_name is TableDataNormalizer._validate_table_name
+            and cls._normalize_table_name is TableDataNormalizer._normalize_table_name
+        )
+
+    def _is_normalized_header_valid(self) -> bool:
+        cls = type(self)
+
+        return (
+            cls._validate_header is TableDataNormalizer._validate_header
+            and cls._normalize_header is TableDataNormalizer._normalize_header
+        )
+
+    def _normalize_headers(self) -> List[str]:
+        if type(self)._preprocess_header is not TableDataNormalizer._preprocess_header:
+            return super()._normalize_headers()
+
+        # _preprocess_header is the identity here: skip calling it per column
+        return self._normalize_header_list(self._tabledata.headers)
+
     def _validate_header(self, header: str) -> None:
+        if isinstance(header, str) and header:
+            return
+
         try:
             typepy.String(header).validate()
         except TypeError as e:
@@ -2,9 +2,11 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from tabledata._common import convert_idx_to_alphabet
+from tabledata._common import _to_alphabet, convert_idx_to_alphabet
 
 
 class Test_convert_idx_to_alphabet:
@@ -85,3 +87,18 @@ class Test_convert_idx_to_alphabet:
     )
     def test_normal(self, value, expected):
         assert [convert_idx_to_alphabet(v) for v in value] == expected
+
+    @pytest.mark.parametrize(
+        ["value"], [[range(1000)], [range(16380, 16390)], [range(-3, 0)], [range(3000, 0, -1)]]
+    )
+    def test_normal_cache(self, value):
+        assert [convert_idx_to_alphabet(v) for v in value] == [_to_alphabet(v) for v in value]
+
+    def test_normal_threads(self):
+        indices = list(range(3000))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(convert_idx_to_alphabet, indices * 8))
+
+        assert results == [_to_alphabet(v) for v in indices * 8]
+        assert [convert_idx_to_alphabet(v) for v in indices] == [_to_alphabet(v) for v in indices]
@@ -2,9 +2,11 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
 
-from tabledata import to_value_matrix
+import pytest
+
+from tabledata import DataError, to_value_matrix
 
 
 class Test_to_value_matrix:
@@ -53,3 +55,26 @@ class Test_to_value_matrix:
             )
             == expect
         )
+
+    def test_normal_namedtuple_rows(self):
+        Row = namedtuple("Row", "A B")
+        expect = [[1, None, 2.1], [3, None, 4.1], [5, 6, None]]
+
+        assert (
+            to_value_matrix(
+                ["A", "C", "B"],
+                [Row(1, 2.1), Row(3, 4.1), {"A": 5, "C": 6}],
+            )
+            == expect
+        )
+
+    @pytest.mark.parametrize(
+        ["headers", "rows"],
+        [
+            [[["x"], "b"], [{"b": 1}]],
+            [["a"], [1]],
+        ],
+    )
+    def test_exception(self, headers, rows):
+        with pytest.raises(DataError):
+            to_value_matrix(headers, rows)
@@ -1,6 +1,8 @@
+import weakref
+
 import pytest
 
-from tabledata import TableData
+from tabledata import InvalidHeaderNameError, TableData
 from tabledata.normalizer import TableDataNormalizer
 
 
@@ -46,3 +48,54 @@ class Test_TableDataNormalizer:
         new_tabledata = TableDataNormalizer(TableData(table_name, headers, rows)).normalize()
 
         assert new_tabledata.equals(expected)
+
+    def test_normal_preprocess_header(self):
+        class UpperHeaderNormalizer(TableDataNormalizer):
+            def _preprocess_header(self, col_idx, header):
+                return header.upper()
+
+        new_tabledata = UpperHeaderNormalizer(
+            TableData("preprocess", ["a", "b"], [[1, 2], [3, 4]])
+        ).normalize()
+
+        assert new_tabledata.headers == ["A", "B"]
+
+    def test_normal_non_str_header(self):
+        new_tabledata = TableDataNormalizer(
+            TableData("non_str", ["a", None, 1], [[1, 2, 3]])
+        ).normalize()
+
+        assert new_tabledata.headers == ["a", "None", "1"]
+
+    def test_exception_subclass_revalidate(self):
+        class StrictHeaderNormalizer(TableDataNormalizer):
+            def _validate_header(self, header):
+                if header.startswith("_"):
+                    raise InvalidHeaderNameError(header)
+
+            def _normalize_header(self, header):
+                return header
+
+        with pytest.raises(InvalidHeaderNameError):
+            StrictHeaderNormalizer(TableData("strict", ["a", "_b"], [[1, 2]])).normalize()
+
+    def test_normal_weakref(self):
+        normalizer = TableDataNormalizer(TableData("weakref", ["a"], [[1]]))
+
+        assert weakref.ref(normalizer)() is normalizer
+
+    def test_normal_skip_revalidation(self):
+        class PreprocessNormalizer(TableDataNormalizer):
+            def _preprocess_header(self, col_idx, header):
+                return header.strip()
+
+        class StrictNormalizer(TableDataNormalizer):
+            def _validate_header(self, header):
+                super()._validate_header(header)
+
+        tabledata = TableData("skip", ["a"], [[1]])
+
+        assert PreprocessNormalizer(tabledata)._is_normalized_header_valid()
+        assert PreprocessNormalizer(tabledata)._is_normalized_table_name_valid()
+        assert not StrictNormalizer(tabledata)._is_normalized_header_valid()
+        assert StrictNormalizer(tabledata)._is_normalized_table_name_valid()
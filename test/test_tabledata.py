@@ -2,8 +2,11 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import copy
 import itertools
+import pickle
 import sys
+import weakref
 from collections import OrderedDict, namedtuple
 from decimal import Decimal
 
@@ -70,6 +73,26 @@ class Test_TableData_constructor:
 
         assert tabledata == expected
 
+    def test_normal_headers(self):
+        lhs = TableData("lhs", [1, 2], [[1, 2]])
+        rhs = TableData("rhs", (1.0, 2.0), [])
+
+        assert lhs.headers == [1, 2]
+        assert [type(header) for header in lhs.headers] == [int, int]
+        assert [type(header) for header in rhs.headers] == [float, float]
+        assert TableData("list", ("a", "b"), []).headers == ["a", "b"]
+
+    def test_normal_weakref(self):
+        tabledata = TableData("weakref", ["a", "b"], [[1, 2]])
+
+        assert weakref.ref(tabledata)() is tabledata
+
+    def test_normal_copy(self):
+        tabledata = TableData("copy", ["a", "b"], [[1, 2], [3, 4]])
+
+        assert copy.deepcopy(tabledata) == tabledata
+        assert pickle.loads(pickle.dumps(tabledata)) == tabledata
+
     def test_normal_type_hints(self):
         type_hints = [Integer, String]
         tabledata = TableData("type hints", ["a", "b"], [[1, 2], [1, 2]], type_hints=type_hints)
@@ -117,6 +140,14 @@ class Test_TableData_num_rows:
         assert table_data.num_columns == 2
         assert table_data.num_rows == expected
 
+    def test_normal_iterator_rows(self):
+        table_data = TableData("iterator", ["a", "b"], yield_rows())
+
+        assert table_data.value_matrix == [[1, 2], [3, 4]]
+        assert table_data.num_rows == 2
+        assert table_data.rows == [[1, 2], [3, 4]]
+        assert table_data.filter_column(["a"]) == TableData("iterator", ["a"], [[1], [3]])
+
 
 class Test_TableData_eq:
     __DATA_0 = TableData(
@@ -161,6 +192,18 @@ class Test_TableData_eq:
         assert (lhs == rhs) == expected
         assert (lhs != rhs) == (not expected)
 
+    def test_normal_nan(self):
+        lhs = TableData("nan", ["a", "b"], [[float("nan"), 1], [2, 3]])
+        rhs = TableData("nan", ["a", "b"], [[float("nan"), 1], (2, 3)])
+
+        assert lhs == rhs
+        assert lhs != TableData("nan", ["a", "b"], [[float("nan"), 2], [2, 3]])
+
+    @pytest.mark.parametrize(["value"], [[None], [1], ["tablename"]])
+    def test_normal_not_tabledata(self, value):
+        assert (self.__DATA_11 == value) is False
+        assert (self.__DATA_11 != value) is True
+
 
 class Test_TableData_equals:
     __LHS = TableData("tablename", ["a", "b"], [{"a": 1, "b": 2}, {"a": 11, "b": 12}])
@@ -357,6 +400,20 @@ class Test_TableData_value_dp_matrix:
         assert tabledata.value_dp_matrix == expected.value_dp_matrix
         assert tabledata.has_value_dp_matrix
 
+    def test_normal_lazy(self):
+        tabledata = TableData("lazy", ["a", "b"], [[1, 2], [3, 4]])
+
+        str(tabledata)
+        tabledata.validate_rows()
+        tabledata.is_empty()
+        tabledata.filter_column(["a"])
+        tabledata.transpose()
+        assert tabledata == TableData("lazy", ["a", "b"], [[1, 2], [3, 4]])
+        assert tabledata.num_rows == 2
+        assert tabledata.num_columns == 2
+
+        assert not tabledata.has_value_dp_matrix
+
 
 class Test_TableData_is_empty_header:
     @pytest.mark.parametrize(
@@ -402,7 +459,13 @@ class Test_TableData_is_empty:
 class Test_TableData_validate_rows:
     @pytest.mark.parametrize(
         ["table_name", "headers", "rows"],
-        [["tablename", [], []], ["tablename", ["a", "b"], []], ["tablename", ["a", "b"], [[1, 2]]]],
+        [
+            ["tablename", [], []],
+            ["tablename", ["a", "b"], []],
+            ["tablename", ["a", "b"], [[1, 2]]],
+            ["tablename", ["a", "b"], [{"a": 1, "b": 2}, {"a": 1, "b": 2, "c": 3}]],
+            ["tablename", [["x"], "b"], [[1, 2]]],
+        ],
     )
     def test_normal(self, table_name, headers, rows):
         TableData(table_name, headers, rows).validate_rows()
@@ -412,6 +475,7 @@ class Test_TableData_validate_rows:
         [
             ["tablename", ["a", "b"], [[1]], ValueError],
             ["tablename", ["a", "b"], [[1, 2, 3]], ValueError],
+            ["tablename", ["a", "b"], [[1, 2], {"a": 1}], ValueError],
         ],
     )
     def test_exception(self, table_name, headers, rows, expected):
@@ -477,6 +541,14 @@ class Test_TableData_filter_column:
                     [[1, 2, 4], [11, 12, 14]],
                 ),
             ],
+            [
+                "backreference_patterns",
+                ["aa", "bb", "ab"],
+                [[1, 2, 3]],
+                [r"(a)\1", r"(b)\1"],
+                False,
+                TableData("backreference_patterns", ["aa", "bb"], [[1, 2]]),
+            ],
             [
                 "re_match_pattern",
                 HEADERS,
@@ -549,6 +621,60 @@ class Test_TableData_filter_column:
 
         assert actual == expected
 
+    @pytest.mark.parametrize(
+        ["table_name", "headers", "rows", "pattern", "expected"],
+        [
+            ["empty_rows", HEADERS, [], ["test"], TableData("empty_rows", ["test"], [])],
+            [
+                "dict_rows",
+                HEADERS,
+                [{"abcde": 1, "test": 2}, {"test": 4}],
+                ["test"],
+                TableData("dict_rows", ["test"], [[2], [4]]),
+            ],
+            [
+                "unhashable_header",
+                [["x"], "b"],
+                [[1, 2]],
+                ["b"],
+                TableData("unhashable_header", ["b"], [[2]]),
+            ],
+            [
+                "unhashable_pattern",
+                [["x"], "b"],
+                [[1, 2]],
+                [["x"]],
+                TableData("unhashable_pattern", [["x"]], [[1]]),
+            ],
+            [
+                "no_headers_dict_rows",
+                [],
+                [{"a": 1}],
+                ["a"],
+                TableData("no_headers_dict_rows", [], []),
+            ],
+            [
+                "str_rows",
+                ["a", "b"],
+                ["xy", "zw"],
+                ["b"],
+                TableData("str_rows", ["b"], [["y"], ["w"]]),
+            ],
+            [
+                "ragged_rows",
+                ["a", "b", "c"],
+                [[1, 2], [3, 4, 5]],
+                ["a", "c"],
+                TableData("ragged_rows", ["a"], [[1], [3]]),
+            ],
+        ],
+    )
+    def test_normal_rows(self, table_name, headers, rows, pattern, expected):
+        tabledata = TableData(table_name, headers, rows)
+        actual = tabledata.filter_column(patterns=pattern)
+
+        assert actual == expected
+
     @pytest.mark.parametrize(
         ["table_name", "headers", "rows", "pattern", "is_invert_match", "is_re_match", "expected"],
         [